@@ -1,10 +1,18 @@
+"""A library for installing distributions in editable mode."""
+
+__version__ = "0.2.0"
+
 from ._core import (
     EditableDistributionMetadata as EditableDistributionMetadata,
+    IndexedRedirectorInstaller as IndexedRedirectorInstaller,
     Installer as Installer,
     InstallerOperationError as InstallerOperationError,
+    InstallObserver as InstallObserver,
     LaxSymlinkInstaller as LaxSymlinkInstaller,
     PthFileInstaller as PthFileInstaller,
     RedirectorInstaller as RedirectorInstaller,
     StrictSymlinkInstaller as StrictSymlinkInstaller,
     install as install,
+    read_path_maps as read_path_maps,
+    resolve_path as resolve_path,
 )
@@ -1,14 +1,20 @@
-from collections.abc import Collection
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Mapping
+from fnmatch import fnmatchcase
 from functools import lru_cache
+import hashlib
 import importlib.machinery
 from itertools import starmap
+import json
 import os
 import os.path
 from pathlib import Path
 import pkgutil
 import posixpath
+import struct
 import tempfile
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any, cast
 
 from ._utils import GenericGetitem, uniq
 
@@ -20,6 +26,9 @@ else:
 _PathOrStr: TypeAlias = "os.PathLike[str] | str"
 
 
+_PATH_MAP_SUFFIX = ".path-map.json"
+
+
 class InstallerOperationError(RuntimeError):
     pass
 
@@ -28,6 +37,16 @@ class EditableDistributionMetadata(TypedDict):
     paths: "dict[str, str]"
 
 
+class InstallObserver(Protocol):  # pragma: no cover
+    def __call__(self, event: str, details: "dict[str, object]") -> None:
+        ...
+
+
+def _notify(observer: "InstallObserver | None", event: str, **details: object) -> None:
+    if observer is not None:
+        observer(event, details)
+
+
 def _find_outermost_entity(target: str, source: str) -> "tuple[str, str]":
     target = os.path.normpath(target)
     while os.path.sep in target:
@@ -48,22 +67,30 @@ def _find_parent_folder(target: str, source: str) -> str:
     return os.path.dirname(source)
 
 
-def _normalize_module_name(name: str, suffixes: "tuple[str, ...]") -> str:
+def _get_parent_folders(target: str) -> "list[str]":
+    parts = target.split(posixpath.sep)[:-1]
+    return [posixpath.sep.join(parts[: i + 1]) for i in range(len(parts))]
+
+
+def _normalize_module_name(name: str, suffix_loaders: "dict[str, str]") -> "tuple[str, str]":
     if "." not in name:
-        return name
-    (suffix,) = (s for s in suffixes if name.endswith(s))
-    name = name[: name.rfind(suffix)]
-    return name
+        return (name, "SourceFileLoader")
+    # Module names cannot contain dots, so the suffix must start at the first dot,
+    # e.g. ``.abi3.so`` rather than ``.so``.
+    module_name, dot, suffix = name.partition(".")
+    loader = suffix_loaders.get(dot + suffix)
+    if loader is None:
+        raise InstallerOperationError("Module has an unrecognised suffix.", name)
+    return (module_name, loader)
+
+
+def _is_namespace_package(source: str) -> bool:
+    return os.path.isdir(source) and not os.path.isfile(os.path.join(source, "__init__.py"))
 
 
 def _normalize_package_path(source: str) -> str:
     if os.path.isdir(source):
         source = os.path.join(source, "__init__.py")
-        if not os.path.isfile(source):
-            raise InstallerOperationError(
-                "Implicit namespace packages are not supported by the redirector installer.",
-                source,
-            )
     return source
 
 
@@ -79,14 +106,216 @@ def _can_symlink(output_directory: _PathOrStr) -> bool:
             return False
 
 
+def _get_relative_posix_path(output_directory: _PathOrStr, installed_file: Path) -> str:
+    return posixpath.sep.join(installed_file.relative_to(output_directory).parts)
+
+
 def _append_to_record(
-    output_directory: _PathOrStr, record_path: _PathOrStr, installed_files: "Collection[Path]"
+    output_directory: _PathOrStr,
+    record_path: _PathOrStr,
+    installed_files: "Collection[Path]",
+    observer: "InstallObserver | None" = None,
 ) -> None:
+    start = time.perf_counter()
     with open(record_path, "a", encoding="utf-8") as record:
         record.writelines(
-            f"{posixpath.sep.join(f.relative_to(output_directory).parts)},,\n"
-            for f in installed_files
+            f"{_get_relative_posix_path(output_directory, f)},,\n" for f in installed_files
         )
+    _notify(
+        observer,
+        "record_appended",
+        path=os.fspath(record_path),
+        count=len(installed_files),
+        duration=time.perf_counter() - start,
+    )
+
+
+def _remove_from_record(
+    output_directory: _PathOrStr, record_path: _PathOrStr, removed_files: "Collection[Path]"
+) -> None:
+    if not removed_files:
+        return
+    removed_entries = {_get_relative_posix_path(output_directory, f) for f in removed_files}
+    with open(record_path, encoding="utf-8") as record:
+        record_entries = record.read().splitlines()
+    with open(record_path, "w", encoding="utf-8") as record:
+        record.writelines(
+            e + "\n" for e in record_entries if e.partition(",")[0] not in removed_entries
+        )
+
+
+def _get_manifest_digest(
+    installer_classes: "Collection[type[Installer]]",
+    name: str,
+    editable_metadata: EditableDistributionMetadata,
+    options: "dict[str, object]",
+) -> str:
+    from . import __version__
+
+    manifest_inputs = [
+        __version__,
+        [repr(i) for i in installer_classes],
+        name,
+        editable_metadata,
+        options,
+    ]
+    return hashlib.sha256(json.dumps(manifest_inputs, sort_keys=True).encode()).hexdigest()
+
+
+def _read_manifest(
+    output_directory: _PathOrStr, manifest_path: Path
+) -> "tuple[str, list[Path]] | None":
+    try:
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            manifest: object = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    digest = cast("dict[str, object]", manifest).get("digest")
+    files = cast("dict[str, object]", manifest).get("files")
+    if not isinstance(digest, str) or not isinstance(files, list):
+        return None
+    entries = cast("list[object]", files)
+    relative_paths = [
+        f
+        for f in entries
+        if isinstance(f, str)
+        and not posixpath.isabs(f)
+        and posixpath.pardir not in f.split(posixpath.sep)
+    ]
+    if len(relative_paths) != len(entries):
+        return None
+    return (digest, [Path(output_directory, f) for f in relative_paths])
+
+
+def _files_exist(files: "Collection[Path]") -> bool:
+    try:
+        for file in files:
+            os.lstat(file)
+    except OSError:
+        return False
+    return True
+
+
+def _remove_empty_parents(output_directory: _PathOrStr, path: _PathOrStr) -> None:
+    output_directory = Path(output_directory)
+    for parent in Path(path).parents:
+        if parent == output_directory or output_directory not in parent.parents:
+            break
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+
+
+def _remove_installed_files(output_directory: _PathOrStr, files: "Collection[Path]") -> None:
+    real_output_directory = os.path.realpath(output_directory)
+    for file in files:
+        # A folder might have been swapped for a symlink to the source tree
+        # since the manifest was written; never delete anything through it.
+        real_parent = os.path.realpath(file.parent)
+        if os.path.commonpath([real_parent, real_output_directory]) != real_output_directory:
+            continue
+        try:
+            os.unlink(file)
+        except OSError:
+            continue
+        _remove_empty_parents(output_directory, file)
+
+
+def _write_manifest(
+    output_directory: _PathOrStr,
+    manifest_path: Path,
+    digest: str,
+    installed_files: "Collection[Path]",
+) -> None:
+    manifest = {
+        "digest": digest,
+        "files": [_get_relative_posix_path(output_directory, f) for f in installed_files],
+    }
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def _write_path_map(path_map_path: Path, symlinks: "dict[Path, str]") -> None:
+    path_map_path.write_text(
+        # Keys are looked up by ``resolve_path`` with absolute paths; sources are
+        # resolved here so that looked up paths match ``os.path.realpath``.
+        json.dumps({os.path.abspath(t): os.path.realpath(s) for t, s in symlinks.items()}),
+        encoding="utf-8",
+    )
+
+
+def read_path_maps(directory: _PathOrStr) -> "dict[str, str]":
+    """Read and merge the path maps written by symlink installers in ``directory``."""
+    path_map: "dict[str, str]" = {}
+    for entry in os.scandir(directory):
+        if entry.name.startswith("_editable_") and entry.name.endswith(_PATH_MAP_SUFFIX):
+            with open(entry.path, encoding="utf-8") as path_map_file:
+                path_map.update(json.load(path_map_file))
+    return path_map
+
+
+def resolve_path(path: _PathOrStr, path_map: "Mapping[str, str]") -> str:
+    """Resolve ``path`` like ``os.path.realpath``, without reading symlinks
+    which are in the ``path_map``.
+    """
+    head = os.path.abspath(path)
+    tail: "list[str]" = []
+    while True:
+        source = path_map.get(head)
+        if source is not None:
+            return os.path.join(source, *reversed(tail))
+
+        parent, name = os.path.split(head)
+        if parent == head:
+            return os.path.realpath(path)
+        head = parent
+        tail.append(name)
+
+
+# Keep in sync with the reader in ``_redirector.py``.
+_REDIRECTOR_INDEX_MAGIC = b"FERI"
+_REDIRECTOR_INDEX_HEADER = struct.Struct("<4sI")
+_REDIRECTOR_INDEX_ENTRY = struct.Struct("<II")
+
+
+def _write_redirector_index(
+    index_path: Path,
+    redirections: "dict[str, tuple[str, str]]",
+    namespace_redirections: "dict[str, list[str]]",
+) -> None:
+    # Each record is a null-separated name, loader name and one or more locations,
+    # with namespace packages having an empty loader name.
+    records = sorted(
+        [
+            *(
+                b"\0".join([n.encode("utf-8"), loader.encode("ascii"), os.fsencode(p)])
+                for n, (loader, p) in redirections.items()
+            ),
+            *(
+                b"\0".join([n.encode("utf-8"), b"", *map(os.fsencode, p)])
+                for n, p in namespace_redirections.items()
+            ),
+        ]
+    )
+    records_offset = _REDIRECTOR_INDEX_HEADER.size + _REDIRECTOR_INDEX_ENTRY.size * len(records)
+    # The index may be mapped by running processes.  Replacing rather than
+    # overwriting it leaves their mappings pointing to the old file.
+    with tempfile.NamedTemporaryFile(
+        dir=index_path.parent, prefix=f"{index_path.name}.", delete=False
+    ) as index:
+        try:
+            index.write(_REDIRECTOR_INDEX_HEADER.pack(_REDIRECTOR_INDEX_MAGIC, len(records)))
+            for record in records:
+                index.write(_REDIRECTOR_INDEX_ENTRY.pack(records_offset, len(record)))
+                records_offset += len(record)
+            index.writelines(records)
+        except BaseException:
+            index.close()
+            os.unlink(index.name)
+            raise
+    os.replace(index.name, index_path)
 
 
 class Installer(Protocol):  # pragma: no cover
@@ -111,86 +340,234 @@ class _BaseInstaller:
         name: str,
         output_directory: _PathOrStr,
         editable_metadata: EditableDistributionMetadata,
+        *,
+        include: "Collection[str] | None" = None,
+        observer: "InstallObserver | None" = None,
     ) -> None:
         self.name = name
         self.output_directory = Path(output_directory)
         self.editable_metadata = editable_metadata
+        self.include = include
+        self.observer = observer
 
     def is_installation_method_supported(self) -> bool:
         return True
 
 
-class _SymlinkInstaller(_BaseInstaller):
+class _SymlinkInstaller(_BaseInstaller, ABC):
+    # The symlinks created by ``install``, mapping their paths to their sources.
+    installed_symlinks: "dict[Path, str]"
+
     def is_installation_method_supported(self) -> bool:
         return _can_symlink(self.output_directory)
 
+    @abstractmethod
+    def get_symlinks(self) -> "dict[Path, str]":
+        """Return the symlinks to create, mapping their paths to their sources."""
 
-class StrictSymlinkInstaller(_SymlinkInstaller):
     def install(self) -> "list[Path]":
-        paths = self.editable_metadata["paths"]
-        packages = uniq(
-            self.output_directory / d for t in paths for d in (posixpath.dirname(t),) if d
+        symlinks = self.installed_symlinks = self.get_symlinks()
+        start = time.perf_counter()
+        parents = uniq(t.parent for t in symlinks if t.parent != self.output_directory)
+        for parent in parents:
+            os.makedirs(parent, exist_ok=True)
+        _notify(
+            self.observer,
+            "folders_created",
+            count=len(parents),
+            duration=time.perf_counter() - start,
         )
-        for package_path in packages:
-            os.makedirs(package_path, exist_ok=True)
 
-        all_files = [self.output_directory / t for t in paths]
-        for target_path, source in zip(all_files, paths.values()):
+        start = time.perf_counter()
+        for target_path, source in symlinks.items():
             target_path.symlink_to(source)
+        _notify(
+            self.observer,
+            "symlinks_created",
+            count=len(symlinks),
+            duration=time.perf_counter() - start,
+        )
+
+        return list(symlinks)
 
-        return all_files
+
+class StrictSymlinkInstaller(_SymlinkInstaller):
+    def get_symlinks(self) -> "dict[Path, str]":
+        paths = self.editable_metadata["paths"]
+        if self.include is None:
+            return {self.output_directory / t: s for t, s in paths.items()}
+
+        include = self.include
+        included_targets = {t for t in paths if any(fnmatchcase(t, p) for p in include)}
+        # Files are symlinked at the outermost folder which can be symlinked
+        # as a whole; other folders are mirrored file by file.  Map each folder
+        # to the source folder it can be symlinked to, or to ``None``.
+        folder_sources: "dict[str, str | None]" = dict.fromkeys(
+            d for t in included_targets for d in _get_parent_folders(t)
+        )
+        for target, source in paths.items():
+            if target in included_targets:
+                continue
+            # A folder cannot be symlinked if it contains included files,
+            # if any of its files are named differently in the source tree,
+            # or if its files come from different source folders.
+            target_parts = target.split(posixpath.sep)
+            folder_source: "str | None" = source
+            for depth, folder in reversed(list(enumerate(_get_parent_folders(target), 1))):
+                if folder_source is not None:
+                    if os.path.basename(folder_source) == target_parts[depth]:
+                        folder_source = os.path.dirname(folder_source)
+                    else:
+                        folder_source = None
+                if folder_sources.setdefault(folder, folder_source) != folder_source:
+                    folder_sources[folder] = None
+
+        symlinks: "dict[Path, str]" = {}
+        for target, source in paths.items():
+            if target not in included_targets:
+                for folder in _get_parent_folders(target):
+                    folder_source = folder_sources[folder]
+                    if folder_source is not None:
+                        target, source = folder, folder_source
+                        break
+            symlinks[self.output_directory / target] = source
+        return symlinks
 
 
 class LaxSymlinkInstaller(_SymlinkInstaller):
-    def install(self) -> "list[Path]":
+    def get_symlinks(self) -> "dict[Path, str]":
         paths = self.editable_metadata["paths"]
         outermost_entities = uniq(starmap(_find_outermost_entity, paths.items()))
-        outermost_paths = [self.output_directory / t for t, _ in outermost_entities]
-        for target_path, (_, source) in zip(outermost_paths, outermost_entities):
-            target_path.symlink_to(source)
-
-        return outermost_paths
+        symlinks = {self.output_directory / t: s for t, s in outermost_entities}
+        if len(symlinks) != len(outermost_entities):
+            raise InstallerOperationError(
+                "Outermost entities must map to a single source to be symlinked.",
+                outermost_entities,
+            )
+        return symlinks
 
 
 class RedirectorInstaller(_BaseInstaller):
     _redirector = pkgutil.get_data(__package__, "_redirector.py")
-    _module_suffixes = tuple(importlib.machinery.all_suffixes())
-
-    def install(self) -> "list[Path]":
+    # The three sets of suffixes are disjoint.
+    _module_suffix_loaders = {
+        **dict.fromkeys(importlib.machinery.BYTECODE_SUFFIXES, "SourcelessFileLoader"),
+        **dict.fromkeys(importlib.machinery.SOURCE_SUFFIXES, "SourceFileLoader"),
+        **dict.fromkeys(importlib.machinery.EXTENSION_SUFFIXES, "ExtensionFileLoader"),
+    }
+
+    def get_redirections(self) -> "tuple[dict[str, tuple[str, str]], dict[str, list[str]]]":
         paths = self.editable_metadata["paths"]
         outermost_entities = uniq(starmap(_find_outermost_entity, paths.items()))
         specs_to_absolute_paths = {
-            # Shear off the extension from module filenames.
-            _normalize_module_name(t, self._module_suffixes):
-            # Append ``/__init__.py`` to the path if it's a package.
-            _normalize_package_path(s)
+            # Shear off the extension from module filenames
+            # and pick the loader for the module from it.
+            m: (
+                loader,
+                # Append ``/__init__.py`` to the path if it's a package.
+                _normalize_package_path(s),
+            )
             for t, s in outermost_entities
+            if not _is_namespace_package(s)
+            for m, loader in (_normalize_module_name(t, self._module_suffix_loaders),)
         }
+        # Namespace packages are mapped to their portions' search locations
+        # so that the finder never has to go looking for them.
+        namespaces_to_absolute_paths: "dict[str, list[str]]" = {}
+        for target, source in outermost_entities:
+            if _is_namespace_package(source):
+                namespaces_to_absolute_paths.setdefault(target, []).append(source)
+        return (specs_to_absolute_paths, namespaces_to_absolute_paths)
+
+    def write_redirections(self, base_name: str) -> "tuple[str, list[Path]]":
+        specs_to_absolute_paths, namespaces_to_absolute_paths = self.get_redirections()
+        return (
+            f"install_redirector({specs_to_absolute_paths}, {namespaces_to_absolute_paths})",
+            [],
+        )
+
+    def install(self) -> "list[Path]":
+        start = time.perf_counter()
         base_name = f"_editable_{self.name}"
         editables_path = self.output_directory / f"{base_name}.py"
         assert self._redirector
         editables_path.write_bytes(self._redirector)
+        install_call, redirection_files = self.write_redirections(base_name)
         pth_file_path = self.output_directory / f"{base_name}.pth"
         pth_file_path.write_text(
-            # fmt: off
-            f"import {base_name}; "
-            f"{base_name}.install_redirector({specs_to_absolute_paths})",
-            # fmt: on
+            f"import {base_name}; {base_name}.{install_call}",
             encoding="utf-8",
         )
-        return [editables_path, pth_file_path]
+        installed_files = [editables_path, *redirection_files, pth_file_path]
+        _notify(
+            self.observer,
+            "files_written",
+            count=len(installed_files),
+            duration=time.perf_counter() - start,
+        )
+        return installed_files
+
+
+class IndexedRedirectorInstaller(RedirectorInstaller):
+    def write_redirections(self, base_name: str) -> "tuple[str, list[Path]]":
+        specs_to_absolute_paths, namespaces_to_absolute_paths = self.get_redirections()
+        index_path = self.output_directory / f"{base_name}.index"
+        _write_redirector_index(index_path, specs_to_absolute_paths, namespaces_to_absolute_paths)
+        return (f"install_indexed_redirector({str(index_path)!r})", [index_path])
 
 
 class PthFileInstaller(_BaseInstaller):
     def install(self) -> "list[Path]":
         paths = self.editable_metadata["paths"]
         parent_folders = uniq(starmap(_find_parent_folder, paths.items()))
+        start = time.perf_counter()
         pth_file_path = self.output_directory / f"_editable_{self.name}.pth"
         pth_file_path.write_text(
             "\n".join(parent_folders),
             encoding="utf-8",
         )
-        return [pth_file_path]
+        installed_files = [pth_file_path]
+        _notify(
+            self.observer,
+            "files_written",
+            count=len(installed_files),
+            duration=time.perf_counter() - start,
+        )
+        return installed_files
+
+
+def sync_strict_symlinks(
+    name: str,
+    output_directory: _PathOrStr,
+    record_path: _PathOrStr,
+    old_paths: "Mapping[str, str]",
+    new_paths: "Mapping[str, str]",
+) -> None:
+    """Bring a strict symlink installation from ``old_paths`` up to date
+    with ``new_paths``, touching only the symlinks and ``RECORD`` lines which differ.
+    """
+    removed = [t for t in old_paths if t not in new_paths]
+    changed = [t for t in old_paths if t in new_paths and old_paths[t] != new_paths[t]]
+    added = {t: s for t, s in new_paths.items() if old_paths.get(t) != s}
+
+    for target in removed + changed:
+        target_path = os.path.join(output_directory, target)
+        try:
+            os.unlink(target_path)
+        except FileNotFoundError:
+            pass
+        if target in removed:
+            _remove_empty_parents(output_directory, target_path)
+
+    _remove_from_record(
+        output_directory, record_path, [Path(output_directory, t) for t in removed]
+    )
+    installed_files = StrictSymlinkInstaller(name, output_directory, {"paths": added}).install()
+    _append_to_record(
+        output_directory,
+        record_path,
+        [f for f, t in zip(installed_files, added) if t not in old_paths],
+    )
 
 
 def install(
@@ -200,15 +577,95 @@ def install(
     editable_metadata: EditableDistributionMetadata,
     *,
     append_to_record: "_PathOrStr | None" = None,
+    use_manifest: bool = False,
+    write_path_map: bool = False,
+    include: "Collection[str] | None" = None,
+    observer: "InstallObserver | None" = None,
 ) -> "list[Path]":
-    """Perform an editable installation and return the list of installed files."""
-    installer = next(
-        c
-        for i in installer_classes
-        for c in (i(name, output_directory, editable_metadata),)
-        if c.is_installation_method_supported()
+    """Perform an editable installation and return the list of installed files.
+
+    If ``use_manifest`` is true, a manifest is written alongside the installed files
+    and a repeat installation with the same inputs is skipped for as long as
+    the files listed in the manifest exist.
+
+    If ``write_path_map`` is true and a symlink installer is selected, a map
+    of symlinks to their sources is written out, to be read by ``read_path_maps``.
+
+    If ``include`` is given, the strict symlink installer only symlinks files
+    matching one of its glob patterns individually, symlinking the remaining files
+    by their outermost folder which does not contain a matching file and mirrors
+    its source folder.
+
+    If an ``observer`` is given, it is called with the name and details
+    of every step of the installation as it completes.
+
+    ``include`` and ``observer`` are passed on to the installers as keyword
+    arguments, and only if they are set; installers which do not accept them
+    can be used as long as they are not.
+    """
+    manifest_path = Path(output_directory, f"_editable_{name}.manifest.json")
+    digest = (
+        _get_manifest_digest(
+            installer_classes,
+            name,
+            editable_metadata,
+            {
+                "write_path_map": write_path_map,
+                "include": None if include is None else list(include),
+            },
+        )
+        if use_manifest
+        else None
     )
+    manifest = _read_manifest(output_directory, manifest_path) if digest is not None else None
+    if manifest is not None:
+        previous_digest, previously_installed_files = manifest
+        if previous_digest == digest and _files_exist(previously_installed_files):
+            installed_files = previously_installed_files + [manifest_path]
+            _notify(observer, "installation_skipped", count=len(installed_files))
+            if append_to_record is not None:
+                _append_to_record(output_directory, append_to_record, installed_files, observer)
+            return installed_files
+
+        # Clear out the previous installation so that it can be redone
+        # by installers which do not overwrite files.
+        _remove_installed_files(output_directory, previously_installed_files + [manifest_path])
+
+    installer_options: "dict[str, Any]" = {}
+    if include is not None:
+        installer_options["include"] = include
+    if observer is not None:
+        installer_options["observer"] = observer
+
+    for installer_class in installer_classes:
+        installer = installer_class(name, output_directory, editable_metadata, **installer_options)
+        start = time.perf_counter()
+        is_supported = installer.is_installation_method_supported()
+        _notify(
+            observer,
+            "method_probed",
+            installer=type(installer).__name__,
+            supported=is_supported,
+            duration=time.perf_counter() - start,
+        )
+        if is_supported:
+            break
+    else:
+        raise InstallerOperationError("None of the installation methods are supported.")
+
+    _notify(observer, "method_chosen", installer=type(installer).__name__)
     installed_files = installer.install()
+    if write_path_map and isinstance(installer, _SymlinkInstaller):
+        start = time.perf_counter()
+        path_map_path = Path(output_directory, f"_editable_{name}{_PATH_MAP_SUFFIX}")
+        _write_path_map(path_map_path, installer.installed_symlinks)
+        installed_files = installed_files + [path_map_path]
+        _notify(observer, "files_written", count=1, duration=time.perf_counter() - start)
+    if digest is not None:
+        start = time.perf_counter()
+        _write_manifest(output_directory, manifest_path, digest, installed_files)
+        installed_files = installed_files + [manifest_path]
+        _notify(observer, "files_written", count=1, duration=time.perf_counter() - start)
     if append_to_record is not None:
-        _append_to_record(output_directory, append_to_record, installed_files)
+        _append_to_record(output_directory, append_to_record, installed_files, observer)
     return installed_files
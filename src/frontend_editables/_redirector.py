@@ -8,31 +8,150 @@ editable installations and a new copy is made at a unique location
 on installation.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+import importlib.machinery
 import importlib.util
+import mmap
+import os
+import struct
 import sys
 
 _redirections = {}
+_namespace_redirections = {}
+_index = None
+
+# Keep in sync with the writer in ``_core.py``.
+_INDEX_MAGIC = b"FERI"
+_INDEX_HEADER = struct.Struct("<4sI")
+_INDEX_ENTRY = struct.Struct("<II")
+
+
+def _search_index(fullname: str) -> "list[bytes] | None":
+    if _index is None:
+        return None
+    key = fullname.encode("utf-8")
+    _, count = _INDEX_HEADER.unpack_from(_index, 0)
+    if _INDEX_HEADER.size + _INDEX_ENTRY.size * count > len(_index):
+        return None
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        offset, length = _INDEX_ENTRY.unpack_from(
+            _index, _INDEX_HEADER.size + _INDEX_ENTRY.size * middle
+        )
+        name_end = _index.find(b"\0", offset, offset + length)
+        if offset + length > len(_index) or name_end == -1:
+            return None
+        name = _index[offset:name_end]
+        if name < key:
+            low = middle + 1
+        elif name > key:
+            high = middle
+        else:
+            return _index[offset : offset + length].split(b"\0")[1:]
+    return None
+
+
+def _find_redirection(fullname: str) -> "tuple[str, str] | None":
+    redirection = _redirections.get(fullname)
+    if redirection is None:
+        record = _search_index(fullname)
+        if record is not None and record[0]:
+            redirection = (record[0].decode("ascii"), os.fsdecode(record[1]))
+    return redirection
+
+
+def _find_namespace_portions(finder: object, fullname: str) -> "list[str]":
+    find_namespace_portions: "Callable[[str], list[str]] | None" = getattr(
+        finder, "find_namespace_portions", None
+    )
+    return [] if find_namespace_portions is None else find_namespace_portions(fullname)
 
 
 class RedirectingFinder:
     @staticmethod
     def find_spec(fullname: str, path: "Sequence[bytes | str] | None", target: object = None):
-        if "." in fullname or path is not None or fullname not in _redirections:
+        if "." in fullname or path is not None:
             return None
-        maybe_spec = importlib.util.spec_from_file_location(fullname, _redirections[fullname])
-        return maybe_spec
 
+        redirection = _find_redirection(fullname)
+        if redirection is not None:
+            loader_name, location = redirection
+            loader = getattr(importlib.machinery, loader_name)(fullname, location)
+            maybe_spec = importlib.util.spec_from_file_location(fullname, location, loader=loader)
+            return maybe_spec
+        return None
 
-def install_redirector(redirections: "dict[str, str]") -> None:
-    global _redirections
-    _redirections = redirections
 
-    for finder in sys.meta_path:
-        if finder is RedirectingFinder:
-            break
-    else:
+class NamespaceFinder:
+    @staticmethod
+    def find_namespace_portions(fullname: str) -> "list[str]":
+        portions = _namespace_redirections.get(fullname)
+        if portions is None:
+            record = _search_index(fullname)
+            portions = [os.fsdecode(p) for p in record[1:]] if record and not record[0] else []
+        return portions
+
+    @staticmethod
+    def find_spec(fullname: str, path: "Sequence[bytes | str] | None", target: object = None):
+        if "." in fullname or path is not None:
+            return None
+        if not NamespaceFinder.find_namespace_portions(fullname):
+            return None
+
+        # A regular package shadows namespace portions, as it would on ``sys.path``.
+        path_spec = importlib.machinery.PathFinder.find_spec(fullname)
+        if path_spec is not None and path_spec.origin not in {None, "namespace"}:
+            return None
+
+        # Namespace portions may be spread across several editable distributions,
+        # each with its own copy of the finder, and across ``sys.path``.
+        locations = [p for f in sys.meta_path for p in _find_namespace_portions(f, fullname)]
+        if path_spec is not None and path_spec.submodule_search_locations is not None:
+            locations.extend(path_spec.submodule_search_locations)
+        spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+        spec.submodule_search_locations = list(dict.fromkeys(locations))
+        return spec
+
+
+def _install_finder() -> None:
+    if RedirectingFinder not in sys.meta_path:
         sys.meta_path.append(
             # Protocols don't support optional members and we do not implement ``find_module``.
             RedirectingFinder,  # type: ignore
         )
+    if NamespaceFinder not in sys.meta_path:
+        # The namespace finder has to run ahead of the path finder, which would
+        # otherwise stop at the first portion it comes across on ``sys.path``.
+        try:
+            index = sys.meta_path.index(importlib.machinery.PathFinder)
+        except ValueError:
+            index = len(sys.meta_path)
+        sys.meta_path.insert(index, NamespaceFinder)
+
+
+def install_redirector(
+    redirections: "dict[str, tuple[str, str]]",
+    namespace_redirections: "dict[str, list[str]] | None" = None,
+) -> None:
+    global _redirections, _namespace_redirections
+    _redirections = redirections
+    _namespace_redirections = namespace_redirections or {}
+    _install_finder()
+
+
+def install_indexed_redirector(index_path: str) -> None:
+    global _index
+    with open(index_path, "rb") as index_file:
+        if os.name == "nt":
+            # Windows refuses to replace a file while it is mapped,
+            # which would stand in the way of reinstalling the distribution.
+            index = index_file.read()
+        else:
+            # The mapping is read-only and backed by the file,
+            # so it is shared between processes through the page cache.
+            index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(index) < _INDEX_HEADER.size or _INDEX_HEADER.unpack_from(index, 0)[0] != _INDEX_MAGIC:
+        raise ValueError("Unrecognised redirector index", index_path)
+    _index = index
+    _install_finder()
@@ -1,21 +1,33 @@
 import argparse
-from collections.abc import Iterator, Sequence
+import base64
+from collections import Counter
+from collections.abc import Collection, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+from functools import partial
+import hashlib
 import json
 import os
 import os.path
 import posixpath
+import select
+import struct
 import subprocess
 import sys
 import tempfile
+import time
 import zipfile
 
 from . import (
+    IndexedRedirectorInstaller,
     LaxSymlinkInstaller,
     PthFileInstaller,
     RedirectorInstaller,
     StrictSymlinkInstaller,
     install,
 )
+from ._core import Installer, sync_strict_symlinks
+from ._utils import uniq
 
 
 def _slice_pairs(path_map: "Sequence[str]") -> "list[tuple[str, str]]":
@@ -26,7 +38,7 @@ def _slice_pairs(path_map: "Sequence[str]") -> "list[tuple[str, str]]":
     return list(zip(it, it))
 
 
-def _get_sources(path: str) -> "Iterator[str]":
+def _get_sources(path: str, missing_ok: bool = False) -> "Iterator[str]":
     try:
         for entry in os.scandir(path):
             if entry.name == "__pycache__":
@@ -34,16 +46,20 @@ def _get_sources(path: str) -> "Iterator[str]":
             elif entry.is_file():
                 yield entry.path
             elif entry.is_dir():
-                yield from _get_sources(entry.path)
+                # The folder might be removed before we get to it.
+                yield from _get_sources(entry.path, missing_ok=True)
     except NotADirectoryError:
         yield path
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
 
 
 def _replace_prefix_and_posixify(entry: str, map_from: str, map_to: str) -> str:
     if not os.path.commonpath([entry, map_from]) == map_from:
         raise ValueError("Unmapped prefix", (entry, map_from))
 
-    return os.path.join(map_to, os.path.relpath(entry, map_from)).replace(
+    return os.path.normpath(os.path.join(map_to, os.path.relpath(entry, map_from))).replace(
         os.path.sep, posixpath.sep
     )
 
@@ -55,7 +71,287 @@ def _get_paths(map_from: str, map_to: str) -> "Iterator[tuple[str, str]]":
     )
 
 
-def _rebuild_wheel(tempdir: str, wheel_path: str) -> None:
+def _get_path_map(path_pairs: "Sequence[tuple[str, str]]") -> "dict[str, str]":
+    return dict(
+        p
+        for f, t in path_pairs
+        for p in _get_paths(os.path.relpath(os.path.normpath(f), os.getcwd()), os.path.normpath(t))
+    )
+
+
+def _get_mtime(path: str) -> "int | None":
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _PollingWatcher:
+    # Folders modified this recently are rescanned on every poll in case
+    # the file system's timestamps are too coarse to tell two changes apart.
+    _RACY_WINDOW = 2_000_000_000
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._mtimes: "dict[str, int | None]" = {}
+        self._refs: "Counter[str]" = Counter()
+
+    def _stamp(self, path: str) -> "int | None":
+        mtime = _get_mtime(path)
+        if mtime is not None and time.time() * 1e9 - mtime < self._RACY_WINDOW:
+            return -1
+        return mtime
+
+    def add(self, folder: str) -> None:
+        self._refs[folder] += 1
+        if self._refs[folder] == 1:
+            self._mtimes[folder] = self._stamp(folder)
+
+    def remove(self, folder: str) -> None:
+        self._refs[folder] -= 1
+        if not self._refs[folder]:
+            del self._refs[folder]
+            del self._mtimes[folder]
+
+    def wait(self) -> "set[str]":
+        time.sleep(self.interval)
+        changed: "set[str]" = set()
+        for folder, mtime in self._mtimes.items():
+            new_mtime = self._stamp(folder)
+            if new_mtime != mtime or mtime == -1:
+                self._mtimes[folder] = new_mtime
+                changed.add(folder)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    _IN_MOVED_FROM = 0x40
+    _IN_MOVED_TO = 0x80
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+    _IN_DELETE_SELF = 0x400
+    _IN_MOVE_SELF = 0x800
+    _IN_Q_OVERFLOW = 0x4000
+    _IN_IGNORED = 0x8000
+    _IN_ONLYDIR = 0x1000000
+    _MASK = (
+        _IN_MOVED_FROM
+        | _IN_MOVED_TO
+        | _IN_CREATE
+        | _IN_DELETE
+        | _IN_DELETE_SELF
+        | _IN_MOVE_SELF
+        | _IN_ONLYDIR
+    )
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd == -1:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._folders: "dict[int, str]" = {}
+        self._descriptors: "dict[str, int]" = {}
+        # Folders which cannot be watched (yet), e.g. missing source roots
+        # or roots which are files.  These are rescanned on every wait.
+        self._unwatched: "set[str]" = set()
+        self._refs: "Counter[str]" = Counter()
+
+    def _add_watch(self, folder: str) -> None:
+        descriptor: int = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self._MASK)
+        if descriptor == -1:
+            self._unwatched.add(folder)
+        else:
+            self._unwatched.discard(folder)
+            self._folders[descriptor] = folder
+            self._descriptors[folder] = descriptor
+
+    def _forget(self, descriptor: int) -> None:
+        folder = self._folders.pop(descriptor, None)
+        if folder is not None and self._descriptors.get(folder) == descriptor:
+            del self._descriptors[folder]
+            if folder in self._refs:
+                self._unwatched.add(folder)
+
+    def add(self, folder: str) -> None:
+        self._refs[folder] += 1
+        if self._refs[folder] == 1:
+            self._add_watch(folder)
+
+    def remove(self, folder: str) -> None:
+        self._refs[folder] -= 1
+        if not self._refs[folder]:
+            del self._refs[folder]
+            self._unwatched.discard(folder)
+            descriptor = self._descriptors.pop(folder, None)
+            if descriptor is not None:
+                del self._folders[descriptor]
+                self._libc.inotify_rm_watch(self._fd, descriptor)
+
+    def wait(self) -> "set[str]":
+        select.select([self._fd], [], [], self.interval if self._unwatched else None)
+        changed = set(self._unwatched)
+        for folder in list(self._unwatched):
+            self._add_watch(folder)
+
+        while True:
+            try:
+                buffer = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                descriptor, mask, _, length = self._EVENT.unpack_from(buffer, offset)
+                offset += self._EVENT.size + length
+                if mask & self._IN_Q_OVERFLOW:
+                    changed.update(self._refs)
+                    continue
+                folder = self._folders.get(descriptor)
+                if folder is None:
+                    continue
+                changed.add(folder)
+                if mask & (self._IN_DELETE_SELF | self._IN_MOVE_SELF):
+                    self._libc.inotify_rm_watch(self._fd, descriptor)
+                    self._forget(descriptor)
+                elif mask & self._IN_IGNORED:
+                    self._forget(descriptor)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _get_watcher(interval: float) -> "_PollingWatcher | _InotifyWatcher":
+    if sys.platform == "linux":
+        try:
+            return _InotifyWatcher(interval)
+        except (AttributeError, OSError):
+            pass
+    return _PollingWatcher(interval)
+
+
+class _SourceTree:
+    """The files under a single source path, tracked folder by folder
+    so that only the folders which have changed need to be rescanned.
+    """
+
+    def __init__(
+        self, map_from: str, map_to: str, watcher: "_PollingWatcher | _InotifyWatcher"
+    ) -> None:
+        self.map_from = map_from
+        self.map_to = map_to
+        self.watcher = watcher
+        self._paths: "dict[str, dict[str, str]]" = {}
+        self._children: "dict[str, list[str]]" = {}
+        self._add(map_from)
+
+    def _add(self, folder: str) -> None:
+        # Watch before scanning so that changes made during the scan are not lost.
+        self.watcher.add(folder)
+        self._paths[folder] = {}
+        self._children[folder] = []
+        self._scan(folder)
+
+    def _remove(self, folder: str) -> None:
+        for child in self._children.pop(folder):
+            self._remove(child)
+        del self._paths[folder]
+        self.watcher.remove(folder)
+
+    def _scan(self, folder: str) -> bool:
+        files: "list[str]" = []
+        children: "list[str]" = []
+        try:
+            for entry in os.scandir(folder):
+                if entry.name == "__pycache__":
+                    continue
+                elif entry.is_file():
+                    files.append(entry.path)
+                elif entry.is_dir():
+                    children.append(entry.path)
+        except NotADirectoryError:
+            if folder == self.map_from:
+                files.append(folder)
+        except FileNotFoundError:
+            pass
+
+        paths = {
+            _replace_prefix_and_posixify(f, self.map_from, self.map_to): os.path.abspath(f)
+            for f in files
+        }
+        if paths == self._paths[folder] and children == self._children[folder]:
+            return False
+
+        self._paths[folder] = paths
+        for child in self._children[folder]:
+            if child not in children:
+                self._remove(child)
+        for child in children:
+            if child not in self._children:
+                self._add(child)
+        self._children[folder] = children
+        return True
+
+    def update(self, folders: "Collection[str]") -> bool:
+        # Rescanning a folder may remove its subfolders, so membership is checked lazily.
+        return any([self._scan(f) for f in folders if f in self._paths])
+
+    def get_paths(self) -> "dict[str, str]":
+        return {t: s for p in self._paths.values() for t, s in p.items()}
+
+
+def _watch(
+    targets: "Sequence[tuple[str, str, str]]",
+    path_pairs: "Sequence[tuple[str, str]]",
+    paths: "dict[str, str]",
+    interval: float,
+) -> None:
+    watcher = _get_watcher(interval)
+    try:
+        trees = [
+            _SourceTree(
+                os.path.relpath(os.path.normpath(f), os.getcwd()), os.path.normpath(t), watcher
+            )
+            for f, t in path_pairs
+        ]
+        while True:
+            new_paths = {t: s for r in trees for t, s in r.get_paths().items()}
+            if new_paths != paths:
+                for name, output_directory, record_path in targets:
+                    sync_strict_symlinks(name, output_directory, record_path, paths, new_paths)
+                paths = new_paths
+
+            updated = False
+            while not updated:
+                changed = watcher.wait()
+                updated = any([r.update(changed) for r in trees])
+    finally:
+        watcher.close()
+
+
+def _get_pure_wheel_name(wheel_name: str) -> str:
+    name_parts = wheel_name[: -len(".whl")].split("-")[:-3]
+    return "-".join([*name_parts, "py3", "none", "any"]) + ".whl"
+
+
+def _retag_wheel_metadata(wheel_metadata: str) -> str:
+    entries = [
+        e for e in wheel_metadata.splitlines() if not e.startswith(("Root-Is-Purelib:", "Tag:"))
+    ]
+    return "".join(e + "\n" for e in entries + ["Root-Is-Purelib: true", "Tag: py3-none-any"])
+
+
+def _get_record_hash(data: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+    return f"sha256={digest.decode('ascii')},{len(data)}"
+
+
+def _rebuild_wheel(tempdir: str, wheel_path: str) -> str:
     with zipfile.ZipFile(wheel_path) as wheel:
         wheel.extractall(
             tempdir,
@@ -66,28 +362,49 @@ def _rebuild_wheel(tempdir: str, wheel_path: str) -> None:
                 if h.endswith((".data", ".dist-info"))
             ),
         )
+    os.unlink(wheel_path)
 
-    with zipfile.ZipFile(wheel_path, "w") as wheel:
-        for file in _get_sources(tempdir):
-            absolute_path = os.path.join(tempdir, file)
-            in_wheel_path = os.path.relpath(file, tempdir)
-            if os.path.basename(file) == "RECORD":
-                with open(absolute_path, encoding="utf-8") as record_file:
+    # Only metadata and data remain, so the wheel is retagged as pure Python
+    # to be installable into environments other than the one it was built in.
+    rebuilt_wheel_path = os.path.join(tempdir, _get_pure_wheel_name(os.path.basename(wheel_path)))
+    files = [
+        (f, os.path.relpath(f, tempdir).replace(os.path.sep, posixpath.sep))
+        for f in _get_sources(tempdir)
+    ]
+    wheel_metadata: "dict[str, bytes]" = {}
+    for file, in_wheel_path in files:
+        head, _, tail = in_wheel_path.partition(posixpath.sep)
+        if head.endswith(".dist-info") and tail == "WHEEL":
+            with open(file, encoding="utf-8") as wheel_metadata_file:
+                wheel_metadata[in_wheel_path] = _retag_wheel_metadata(
+                    wheel_metadata_file.read()
+                ).encode("utf-8")
+
+    with zipfile.ZipFile(rebuilt_wheel_path, "w") as wheel:
+        for file, in_wheel_path in files:
+            if in_wheel_path in wheel_metadata:
+                wheel.writestr(in_wheel_path, wheel_metadata[in_wheel_path])
+            elif os.path.basename(file) == "RECORD":
+                with open(file, encoding="utf-8") as record_file:
                     record_entries = record_file.read().splitlines()
                 wheel.writestr(
                     in_wheel_path,
                     "".join(
-                        e + "\n"
+                        (
+                            f"{p},{_get_record_hash(wheel_metadata[p])}"
+                            if p in wheel_metadata
+                            else e
+                        )
+                        + "\n"
                         for e in record_entries
                         for p, _, _ in (e.partition(","),)
                         for h, _, _ in (p.partition(posixpath.sep),)
                         if h.endswith((".data", ".dist-info"))
                     ),
                 )
-            elif absolute_path == wheel_path:
-                continue
             else:
-                wheel.write(absolute_path, in_wheel_path)
+                wheel.write(file, in_wheel_path)
+    return rebuilt_wheel_path
 
 
 def _pip_build_wheel(tempdir: str, spec: str) -> str:
@@ -97,23 +414,51 @@ def _pip_build_wheel(tempdir: str, spec: str) -> str:
     return next(os.scandir(tempdir)).path
 
 
-def _pip_install_wheel(wheel_path: str, spec: str) -> None:
+def _pip_install_wheel(executable: str, wheel_path: str, spec: str) -> None:
     extras_sep = spec.find("[")
     extras = spec[extras_sep:] if extras_sep != -1 else ""
     subprocess.check_call(
-        [sys.executable, "-m", "pip", "install", wheel_path + extras],
+        [executable, "-m", "pip", "install", wheel_path + extras],
     )
 
 
-def _pip_info_json() -> "list[dict[str, str]]":
+def _pip_info_json(executable: str) -> "list[dict[str, str]]":
     return json.loads(
         subprocess.check_output(
-            [sys.executable, "-m", "pip", "--verbose", "list", "--format", "json"],
+            [executable, "-m", "pip", "--verbose", "list", "--format", "json"],
         )
     )
 
 
+def _install_into_environment(
+    executable: str,
+    wheel_path: str,
+    spec: str,
+    installer_classes: "Sequence[type[Installer]]",
+    paths: "dict[str, str]",
+    include: "Sequence[str] | None",
+) -> "tuple[str, str, str]":
+    _pip_install_wheel(executable, wheel_path, spec)
+    pip_info = _pip_info_json(executable)
+    distribution, _, _ = os.path.basename(wheel_path).partition("-")
+    normalized_distribution = distribution.replace("_", "-")
+    package = next(i for i in pip_info if i["name"] == normalized_distribution)
+    record_path = os.path.join(
+        package["location"], f"{distribution}-{package['version']}.dist-info", "RECORD"
+    )
+    install(
+        installer_classes,
+        package["name"],
+        package["location"],
+        {"paths": paths},
+        append_to_record=record_path,
+        include=include,
+    )
+    return (package["name"], package["location"], record_path)
+
+
 _METHODS = {
+    "indexed_redirector": IndexedRedirectorInstaller,
     "lax_symlink": LaxSymlinkInstaller,
     "pth_file": PthFileInstaller,
     "redirector": RedirectorInstaller,
@@ -145,32 +490,66 @@ def main(args: "Sequence[str] | None" = None) -> None:
         default=".",
         help="requirement specifier",
     )
+    parser.add_argument(
+        "--python",
+        action="append",
+        metavar="EXECUTABLE",
+        help="interpreter to install into in lieu of the current interpreter; "
+        "repeat to install into several environments in parallel",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="only symlink files matching GLOB individually with strict symlinking; "
+        "can be repeated",
+    )
+    parser.add_argument(
+        "--watch",
+        nargs="?",
+        const=1.0,
+        type=float,
+        metavar="INTERVAL",
+        help="keep strict symlinks in sync with the source tree; "
+        "where file system events are unavailable, poll every INTERVAL seconds",
+    )
     parsed_args = parser.parse_args(args)
+    if parsed_args.watch is not None and parsed_args.method != ["strict_symlink"]:
+        parser.error("--watch can only be used with --method strict_symlink")
+    if parsed_args.include is not None and parsed_args.method != ["strict_symlink"]:
+        parser.error("--include can only be used with --method strict_symlink")
+    if parsed_args.watch is not None and parsed_args.include is not None:
+        parser.error("--watch cannot be used with --include")
 
     path_pairs = _slice_pairs(parsed_args.path_pairs)
-    paths = dict(
-        p
-        for f, t in path_pairs
-        for p in _get_paths(os.path.relpath(os.path.normpath(f), os.getcwd()), os.path.normpath(t))
-    )
+    paths = _get_path_map(path_pairs)
 
     with tempfile.TemporaryDirectory(prefix="frontend-editables-transitional-cli") as tempdir:
         wheel_path = _pip_build_wheel(tempdir, parsed_args.spec)
-        _rebuild_wheel(tempdir, wheel_path)
-        _pip_install_wheel(wheel_path, parsed_args.spec)
-        pip_info = _pip_info_json()
-        distribution, _, _ = os.path.basename(wheel_path).partition("-")
-        normalized_distribution = distribution.replace("_", "-")
-        package = next(i for i in pip_info if i["name"] == normalized_distribution)
-        install(
-            [_METHODS[m] for m in parsed_args.method],
-            package["name"],
-            package["location"],
-            {"paths": paths},
-            append_to_record=os.path.join(
-                package["location"], f"{distribution}-{package['version']}.dist-info", "RECORD"
-            ),
+        wheel_path = _rebuild_wheel(tempdir, wheel_path)
+        executables = uniq(
+            os.path.normcase(os.path.abspath(e)) for e in parsed_args.python or [sys.executable]
         )
+        with ThreadPoolExecutor(max_workers=len(executables)) as executor:
+            targets = list(
+                executor.map(
+                    partial(
+                        _install_into_environment,
+                        wheel_path=wheel_path,
+                        spec=parsed_args.spec,
+                        installer_classes=[_METHODS[m] for m in parsed_args.method],
+                        paths=paths,
+                        include=parsed_args.include,
+                    ),
+                    executables,
+                )
+            )
+
+    if parsed_args.watch is not None:
+        try:
+            _watch(targets, path_pairs, paths, parsed_args.watch)
+        except KeyboardInterrupt:
+            pass
 
 
 if __name__ == "__main__":
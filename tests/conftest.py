@@ -90,3 +90,25 @@ def path_runner(tmp_path):
         subprocess.check_call([sys.executable, str(runner)])
 
     yield run
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-stress", action="store_true", help="run the stress tests")
+    parser.addoption(
+        "--stress-scale",
+        type=float,
+        default=1.0,
+        help="multiplier for the size of the layouts generated by the stress tests",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "stress: large-scale test with time and memory budgets")
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--run-stress"):
+        skip_stress = pytest.mark.skip(reason="needs --run-stress to run")
+        for item in items:
+            if "stress" in item.keywords:
+                item.add_marker(skip_stress)
@@ -0,0 +1,82 @@
+import pytest
+
+import frontend_editables
+
+
+class UnsupportedInstaller(frontend_editables.PthFileInstaller):
+    def is_installation_method_supported(self):
+        return False
+
+
+def test_installation_events_are_reported(tmp_path, dummy_paths, dummy_dist_info):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    events = []
+    installed_files = frontend_editables.install(
+        [UnsupportedInstaller, frontend_editables.StrictSymlinkInstaller],
+        "test_events",
+        output_directory,
+        dummy_paths,
+        append_to_record=dummy_dist_info / "RECORD",
+        observer=lambda e, d: events.append((e, d)),
+    )
+    assert [e for e, _ in events] == [
+        "method_probed",
+        "method_probed",
+        "method_chosen",
+        "folders_created",
+        "symlinks_created",
+        "record_appended",
+    ]
+    assert [d["supported"] for e, d in events if e == "method_probed"] == [False, True]
+    assert events[2][1] == {"installer": "StrictSymlinkInstaller"}
+    assert events[4][1]["count"] == len(installed_files)
+    assert events[5][1]["path"] == str(dummy_dist_info / "RECORD")
+
+
+def test_unsupported_installation_methods_raise(tmp_path, dummy_paths):
+    with pytest.raises(
+        frontend_editables.InstallerOperationError,
+        match="None of the installation methods are supported",
+    ):
+        frontend_editables.install(
+            [UnsupportedInstaller],
+            "test_events",
+            tmp_path,
+            dummy_paths,
+        )
+
+
+class MinimalInstaller:
+    def __init__(self, name, output_directory, editable_metadata):
+        self.output_directory = output_directory
+
+    def is_installation_method_supported(self):
+        return True
+
+    def install(self):
+        return [self.output_directory / "minimal"]
+
+
+def test_installers_without_options_can_be_used(tmp_path, dummy_paths):
+    assert frontend_editables.install(
+        [MinimalInstaller],
+        "test_events",
+        tmp_path,
+        dummy_paths,
+    ) == [tmp_path / "minimal"]
+
+
+def test_path_map_and_manifest_writes_are_reported(tmp_path, dummy_paths):
+    events = []
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_events",
+        tmp_path,
+        dummy_paths,
+        use_manifest=True,
+        write_path_map=True,
+        observer=lambda e, d: events.append((e, d)),
+    )
+    assert [e for e, _ in events][-3:] == ["symlinks_created", "files_written", "files_written"]
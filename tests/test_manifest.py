@@ -0,0 +1,140 @@
+import os.path
+
+import frontend_editables
+
+
+def test_unchanged_reinstall_is_skipped(tmp_path, dummy_paths):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    installed_files = frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_manifest",
+        output_directory,
+        dummy_paths,
+        use_manifest=True,
+    )
+    # Symlinking the same files a second time would raise ``FileExistsError``.
+    assert (
+        frontend_editables.install(
+            [frontend_editables.StrictSymlinkInstaller],
+            "test_manifest",
+            output_directory,
+            dummy_paths,
+            use_manifest=True,
+        )
+        == installed_files
+    )
+
+
+def test_reinstall_is_not_skipped_if_inputs_change(tmp_path):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    for source_directory in [tmp_path / "foo", tmp_path / "bar"]:
+        frontend_editables.install(
+            [frontend_editables.PthFileInstaller],
+            "test_manifest",
+            output_directory,
+            {"paths": {"baz.py": str(source_directory / "baz.py")}},
+            use_manifest=True,
+        )
+        (pth_file,) = output_directory.glob("*.pth")
+        assert pth_file.read_text(encoding="utf-8") == str(source_directory)
+
+
+def test_reinstall_is_not_skipped_if_installed_files_are_missing(tmp_path):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    for _ in range(2):
+        installed_files = frontend_editables.install(
+            [frontend_editables.PthFileInstaller],
+            "test_manifest",
+            output_directory,
+            {"paths": {"baz.py": str(tmp_path / "foo" / "baz.py")}},
+            use_manifest=True,
+        )
+        (pth_file,) = output_directory.glob("*.pth")
+        assert pth_file in installed_files
+        pth_file.unlink()
+
+
+def test_symlinks_are_reinstalled_if_installed_files_are_missing(tmp_path, dummy_paths):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    for _ in range(2):
+        installed_files = frontend_editables.install(
+            [frontend_editables.StrictSymlinkInstaller],
+            "test_manifest",
+            output_directory,
+            dummy_paths,
+            use_manifest=True,
+        )
+        assert all(os.path.lexists(f) for f in installed_files)
+        installed_files[0].unlink()
+
+
+def test_reinstall_is_not_skipped_if_manifest_is_malformed(tmp_path):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    output_directory.joinpath("_editable_test_manifest.manifest.json").write_text(
+        "[]", encoding="utf-8"
+    )
+
+    installed_files = frontend_editables.install(
+        [frontend_editables.PthFileInstaller],
+        "test_manifest",
+        output_directory,
+        {"paths": {"baz.py": str(tmp_path / "foo" / "baz.py")}},
+        use_manifest=True,
+    )
+    assert all(f.exists() for f in installed_files)
+
+
+def test_symlinks_are_reinstalled_if_inputs_change(tmp_path, dummy_paths):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    for installers in [
+        [frontend_editables.StrictSymlinkInstaller],
+        [frontend_editables.LaxSymlinkInstaller],
+    ]:
+        installed_files = frontend_editables.install(
+            installers,
+            "test_manifest",
+            output_directory,
+            dummy_paths,
+            use_manifest=True,
+        )
+        assert all(os.path.lexists(f) for f in installed_files)
+    assert all(f.parent == output_directory for f in installed_files)
+
+
+def test_stale_files_are_not_removed_through_folder_symlinks(tmp_path):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    source = tmp_path / "in" / "foo" / "bar.py"
+    source.parent.mkdir(parents=True)
+    source.touch()
+
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_manifest",
+        output_directory,
+        {"paths": {"foo/bar.py": str(source)}},
+        use_manifest=True,
+    )
+    output_directory.joinpath("foo", "bar.py").unlink()
+    output_directory.joinpath("foo").rmdir()
+    output_directory.joinpath("foo").symlink_to(source.parent, target_is_directory=True)
+
+    frontend_editables.install(
+        [frontend_editables.PthFileInstaller],
+        "test_manifest",
+        output_directory,
+        {"paths": {"foo/bar.py": str(source)}},
+        use_manifest=True,
+    )
+    assert source.exists()
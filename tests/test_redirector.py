@@ -1,57 +1,170 @@
-import contextlib
+import importlib.machinery
+import importlib.util
+import py_compile
+import sys
 
 import pytest
 
 import frontend_editables
+from frontend_editables._core import _normalize_module_name
 
 
-@contextlib.contextmanager
-def nullcontext():
-    yield
+def test_redirector_paths_are_added_to_record(tmp_path, dummy_paths, dummy_dist_info):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
 
+    frontend_editables.install(
+        [frontend_editables.RedirectorInstaller],
+        "test_redirector",
+        output_directory,
+        dummy_paths,
+        append_to_record=dummy_dist_info / "RECORD",
+    )
+    (pth_file,) = output_directory.glob("*.pth")
+    assert (
+        (dummy_dist_info / "RECORD").read_text(encoding="utf-8").endswith(f"{pth_file.name},,\n")
+    )
 
-@pytest.fixture
-def errorcontext(request):
-    if request.node.callspec.id == "namespace-package-only":
-        yield pytest.raises(
-            frontend_editables.InstallerOperationError,
-            match="Implicit namespace packages are not supported",
-        )
-    else:
-        yield nullcontext()
 
+def test_redirector_modules_can_be_imported(tmp_path, dummy_paths, path_runner):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    frontend_editables.install(
+        [frontend_editables.RedirectorInstaller],
+        "test_redirector",
+        output_directory,
+        dummy_paths,
+    )
+    path_runner(*dummy_paths["paths"], python_path=output_directory)
 
-def test_redirector_paths_are_added_to_record(
-    tmp_path, dummy_paths, dummy_dist_info, errorcontext
+
+@pytest.mark.parametrize(
+    "installers",
+    [[frontend_editables.RedirectorInstaller], [frontend_editables.IndexedRedirectorInstaller]],
+)
+def test_redirector_namespace_portions_can_be_imported_across_distributions(
+    tmp_path, path_runner, installers
 ):
     output_directory = tmp_path / "out"
     output_directory.mkdir()
 
-    with errorcontext:
+    for name in ["foo", "bar"]:
+        source = tmp_path / name / "ns" / name / "__init__.py"
+        source.parent.mkdir(parents=True)
+        source.touch()
         frontend_editables.install(
-            [frontend_editables.RedirectorInstaller],
-            "test_redirector",
+            installers,
+            f"test_redirector_{name}",
             output_directory,
-            dummy_paths,
-            append_to_record=dummy_dist_info / "RECORD",
+            {"paths": {f"ns/{name}/__init__.py": str(source)}},
         )
-        (pth_file,) = output_directory.glob("*.pth")
-        assert (
-            (dummy_dist_info / "RECORD")
-            .read_text(encoding="utf-8")
-            .endswith(f"{pth_file.name},,\n")
+    path_runner("ns/foo/__init__.py", "ns/bar/__init__.py", python_path=output_directory)
+
+
+@pytest.mark.parametrize(
+    "installers",
+    [[frontend_editables.RedirectorInstaller], [frontend_editables.IndexedRedirectorInstaller]],
+)
+def test_redirector_namespace_portions_can_be_imported_alongside_installed_portions(
+    tmp_path, path_runner, installers
+):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    # A portion installed normally, which the path finder comes across first.
+    installed_portion = output_directory / "ns" / "bar" / "__init__.py"
+    installed_portion.parent.mkdir(parents=True)
+    installed_portion.touch()
+
+    source = tmp_path / "foo" / "ns" / "foo" / "__init__.py"
+    source.parent.mkdir(parents=True)
+    source.touch()
+    frontend_editables.install(
+        installers,
+        "test_redirector_foo",
+        output_directory,
+        {"paths": {"ns/foo/__init__.py": str(source)}},
+    )
+    path_runner("ns/foo/__init__.py", "ns/bar/__init__.py", python_path=output_directory)
+
+
+def test_redirector_bytecode_modules_can_be_imported(tmp_path, path_runner):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    source = tmp_path / "in" / "foo.py"
+    source.parent.mkdir()
+    source.touch()
+    bytecode = py_compile.compile(str(source), cfile=str(source.with_suffix(".pyc")))
+
+    frontend_editables.install(
+        [frontend_editables.RedirectorInstaller],
+        "test_redirector",
+        output_directory,
+        {"paths": {"foo.pyc": bytecode}},
+    )
+    source.unlink()
+    path_runner("foo.py", python_path=output_directory)
+
+
+def test_redirector_module_suffix_is_matched_greedily():
+    assert _normalize_module_name(
+        f"foo{importlib.machinery.EXTENSION_SUFFIXES[0]}",
+        frontend_editables.RedirectorInstaller._module_suffix_loaders,
+    ) == ("foo", "ExtensionFileLoader")
+
+
+def test_redirector_module_suffix_must_follow_module_name():
+    with pytest.raises(frontend_editables.InstallerOperationError):
+        _normalize_module_name(
+            "foo.cpython-0-unknown.py",
+            frontend_editables.RedirectorInstaller._module_suffix_loaders,
         )
 
 
-def test_redirector_modules_can_be_imported(tmp_path, dummy_paths, path_runner, errorcontext):
+def test_indexed_redirector_modules_can_be_imported(tmp_path, dummy_paths, path_runner):
     output_directory = tmp_path / "out"
     output_directory.mkdir()
 
-    with errorcontext:
+    installed_files = frontend_editables.install(
+        [frontend_editables.IndexedRedirectorInstaller],
+        "test_redirector",
+        output_directory,
+        dummy_paths,
+    )
+    assert output_directory / "_editable_test_redirector.index" in installed_files
+    path_runner(*dummy_paths["paths"], python_path=output_directory)
+
+
+def test_indexed_redirector_index_is_replaced_while_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    def install_modules(count):
+        paths = {}
+        for i in range(count):
+            source = tmp_path / "in" / f"foo{i}.py"
+            source.parent.mkdir(exist_ok=True)
+            source.touch()
+            paths[source.name] = str(source)
         frontend_editables.install(
-            [frontend_editables.RedirectorInstaller],
+            [frontend_editables.IndexedRedirectorInstaller],
             "test_redirector",
             output_directory,
-            dummy_paths,
+            {"paths": paths},
         )
-        path_runner(*dummy_paths["paths"], python_path=output_directory)
+
+    install_modules(1)
+    index_path = output_directory / "_editable_test_redirector.index"
+    spec = importlib.util.spec_from_file_location(
+        "_editable_test_redirector", output_directory / "_editable_test_redirector.py"
+    )
+    redirector = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(redirector)
+    redirector.install_indexed_redirector(str(index_path))
+
+    install_modules(3000)
+    assert redirector.RedirectingFinder.find_spec("foo0", None) is not None
+    assert redirector.RedirectingFinder.find_spec("foo1", None) is None
+    assert redirector.RedirectingFinder.find_spec("bar", None) is None
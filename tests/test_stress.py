@@ -0,0 +1,171 @@
+import importlib.machinery
+import os
+import os.path
+import posixpath
+import time
+import tracemalloc
+
+import pytest
+
+import frontend_editables
+from frontend_editables import transitional_cli
+
+pytestmark = pytest.mark.stress
+
+TOTAL_FILES = 100_000
+TOP_LEVEL_PACKAGES = 250
+DISTRIBUTIONS = 25
+NESTING_DEPTH = 12
+
+# Memory budgets are per file in the layout, on top of a fixed allowance,
+# so that they scale with ``--stress-scale``.  They are roughly three times
+# what was measured.
+BASE_MEMORY_BUDGET = 2 * 2 ** 20
+
+# Installer memory peaks track the size of the largest distribution,
+# since distributions are installed one at a time.
+INSTALLER_MEMORY_BUDGETS = {
+    # name: (installer, bytes per file)
+    "lax_symlink": (frontend_editables.LaxSymlinkInstaller, 16),
+    "strict_symlink": (frontend_editables.StrictSymlinkInstaller, 1500),
+    "redirector": (frontend_editables.RedirectorInstaller, 16),
+    "indexed_redirector": (frontend_editables.IndexedRedirectorInstaller, 16),
+    "pth_file": (frontend_editables.PthFileInstaller, 16),
+}
+PATH_DISCOVERY_MEMORY_BUDGET = 768
+
+# Wall-clock budgets depend on the machine, so timings are instead compared
+# between the layout and one ``SCALE_DOWN`` times smaller: the time taken per
+# file may grow at most ``MAX_TIME_PER_FILE_RATIO`` times.  Linear operations
+# come in at around 1, quadratic ones at around ``SCALE_DOWN``.
+SCALE_DOWN = 10
+MAX_TIME_PER_FILE_RATIO = 3
+# The smaller layout is timed several times, keeping the fastest run,
+# which also warms up the caches for the larger layout.
+SMALL_LAYOUT_RUNS = 3
+
+
+def _generate_layout(source_root, scale):
+    packages = max(int(TOP_LEVEL_PACKAGES * scale), DISTRIBUTIONS)
+    files_per_package = max(int(TOTAL_FILES * scale) // packages, NESTING_DEPTH + 1)
+    extension_suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+
+    paths = {}
+    for p in range(packages):
+        directories = [
+            posixpath.join(f"pkg{p}", *(f"sub{d}" for d in range(n)))
+            for n in range(NESTING_DEPTH + 1)
+        ]
+        for f in range(files_per_package):
+            directory = directories[f % len(directories)]
+            if f < len(directories):
+                name = "__init__.py"
+            elif f % 10 == 0:
+                name = f"ext{f}{extension_suffix}"
+            else:
+                name = f"mod{f}.py"
+            target = posixpath.join(directory, name)
+            paths[target] = os.path.join(source_root, *target.split(posixpath.sep))
+        paths[f"mod{p}.py"] = os.path.join(source_root, f"mod{p}.py")
+        paths[f"ext{p}{extension_suffix}"] = os.path.join(source_root, f"ext{p}{extension_suffix}")
+
+    for directory in {os.path.dirname(s) for s in paths.values()}:
+        os.makedirs(directory, exist_ok=True)
+    for source in paths.values():
+        with open(source, "wb"):
+            pass
+
+    distributions = [{} for _ in range(DISTRIBUTIONS)]
+    for target, source in paths.items():
+        top_level_name = target.partition(posixpath.sep)[0].partition(".")[0]
+        distributions[int(top_level_name[3:]) % DISTRIBUTIONS][target] = source
+    return distributions
+
+
+@pytest.fixture(scope="module")
+def stress_layouts(request, tmp_path_factory):
+    scale = request.config.getoption("--stress-scale")
+    layouts = []
+    for name, layout_scale in [("small", scale / SCALE_DOWN), ("large", scale)]:
+        source_root = tmp_path_factory.mktemp(f"stress-{name}") / "src"
+        layouts.append((source_root, _generate_layout(source_root, layout_scale)))
+    yield layouts
+
+
+def measure(function, memory):
+    """Call ``function``, check that its memory usage peaks below ``memory``
+    and return how long the call took.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < memory, f"peaked at {peak} bytes, budget is {memory} bytes"
+    return elapsed
+
+
+def assert_scales_linearly(small_layout_seconds_per_file, large_layout_seconds_per_file):
+    ratio = large_layout_seconds_per_file / small_layout_seconds_per_file
+    assert ratio < MAX_TIME_PER_FILE_RATIO, (
+        f"time per file grew {ratio:.1f} times from the small to the large layout, "
+        f"limit is {MAX_TIME_PER_FILE_RATIO}"
+    )
+
+
+@pytest.mark.parametrize(
+    "installer_budget", INSTALLER_MEMORY_BUDGETS.values(), ids=INSTALLER_MEMORY_BUDGETS
+)
+def test_installers_within_budget(tmp_path, dummy_dist_info, stress_layouts, installer_budget):
+    installer, bytes_per_file = installer_budget
+
+    def install_distributions(output_directory, distributions):
+        for i, paths in enumerate(distributions):
+            frontend_editables.install(
+                [installer],
+                f"test_stress_{i}",
+                output_directory,
+                {"paths": paths},
+                append_to_record=dummy_dist_info / "RECORD",
+            )
+
+    seconds_per_file = []
+    for (_, distributions), runs in zip(stress_layouts, [SMALL_LAYOUT_RUNS, 1]):
+        total_files = sum(map(len, distributions))
+        largest_distribution_files = max(map(len, distributions))
+        timings = []
+        for _ in range(runs):
+            output_directory = tmp_path / f"out{len(seconds_per_file)}-{len(timings)}"
+            output_directory.mkdir()
+            timings.append(
+                measure(
+                    lambda: install_distributions(output_directory, distributions),
+                    BASE_MEMORY_BUDGET + bytes_per_file * largest_distribution_files,
+                )
+            )
+        seconds_per_file.append(min(timings) / total_files)
+    assert_scales_linearly(*seconds_per_file)
+
+
+def test_cli_path_discovery_within_budget(stress_layouts):
+    seconds_per_file = []
+    for (source_root, distributions), runs in zip(stress_layouts, [SMALL_LAYOUT_RUNS, 1]):
+        path_pairs = [
+            (os.path.join(source_root, n), n)
+            for n in sorted({t.partition(posixpath.sep)[0] for d in distributions for t in d})
+        ]
+        total_files = sum(map(len, distributions))
+        paths = {}
+        timings = [
+            measure(
+                lambda: paths.update(transitional_cli._get_path_map(path_pairs)),
+                BASE_MEMORY_BUDGET + PATH_DISCOVERY_MEMORY_BUDGET * total_files,
+            )
+            for _ in range(runs)
+        ]
+        assert paths == {t: s for d in distributions for t, s in d.items()}
+        seconds_per_file.append(min(timings) / total_files)
+    assert_scales_linearly(*seconds_per_file)
@@ -1,8 +1,10 @@
+import os.path
 import posixpath
 
 import pytest
 
 import frontend_editables
+from frontend_editables._core import sync_strict_symlinks
 from frontend_editables._utils import uniq
 
 
@@ -99,3 +101,203 @@ def test_symlinks_can_be_imported(tmp_path, dummy_paths, path_runner, installers
         dummy_paths,
     )
     path_runner(*dummy_paths["paths"], python_path=output_directory)
+
+
+@pytest.mark.parametrize(
+    "installers",
+    [[frontend_editables.LaxSymlinkInstaller], [frontend_editables.StrictSymlinkInstaller]],
+)
+def test_symlinks_are_resolved_from_path_map(tmp_path, dummy_paths, installers):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    installed_files = frontend_editables.install(
+        installers,
+        "test_symlink",
+        output_directory,
+        dummy_paths,
+        write_path_map=True,
+    )
+    assert output_directory / "_editable_test_symlink.path-map.json" in installed_files
+
+    path_map = frontend_editables.read_path_maps(output_directory)
+    assert all(
+        frontend_editables.resolve_path(output_directory / t, path_map)
+        == os.path.realpath(output_directory / t)
+        for t in dummy_paths["paths"]
+    )
+
+
+def test_path_map_reuses_symlinks_of_installation(tmp_path, monkeypatch, dummy_paths):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    calls = []
+    get_symlinks = frontend_editables.StrictSymlinkInstaller.get_symlinks
+
+    def counting_get_symlinks(self):
+        calls.append(self)
+        return get_symlinks(self)
+
+    monkeypatch.setattr(
+        frontend_editables.StrictSymlinkInstaller, "get_symlinks", counting_get_symlinks
+    )
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_symlink",
+        output_directory,
+        dummy_paths,
+        write_path_map=True,
+    )
+    assert len(calls) == 1
+
+
+def test_symlink_strict_strategy_only_included_files_are_symlinked(tmp_path, path_runner):
+    input_directory = tmp_path / "in"
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    targets = [
+        "foo/__init__.py",
+        "foo/bar/__init__.py",
+        "foo/bar/baz.py",
+        "foo/qux/__init__.py",
+        "foo/qux/quux.py",
+        "corge.py",
+    ]
+    paths = {t: str(input_directory / t) for t in targets}
+    for source in paths.values():
+        os.makedirs(os.path.dirname(source), exist_ok=True)
+        with open(source, "wb"):
+            pass
+
+    installed_files = frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_symlink_strict",
+        output_directory,
+        {"paths": paths},
+        include=["foo/bar/*"],
+    )
+    assert installed_files == [
+        output_directory / "foo" / "__init__.py",
+        output_directory / "foo" / "bar" / "__init__.py",
+        output_directory / "foo" / "bar" / "baz.py",
+        output_directory / "foo" / "qux",
+        output_directory / "corge.py",
+    ]
+    assert not (output_directory / "foo").is_symlink()
+    assert not (output_directory / "foo" / "bar").is_symlink()
+    assert all(f.is_symlink() for f in installed_files)
+    path_runner(*targets, python_path=output_directory)
+
+
+def test_symlink_strict_strategy_folders_with_renamed_files_are_mirrored(tmp_path, path_runner):
+    input_directory = tmp_path / "in"
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    paths = {
+        "foo/__init__.py": str(input_directory / "foo" / "__init__.py"),
+        "foo/bar/__init__.py": str(input_directory / "foo" / "bar" / "__init__.py"),
+        "foo/bar/baz.py": str(input_directory / "foo" / "bar" / "qux.py"),
+        "corge/__init__.py": str(input_directory / "corge" / "__init__.py"),
+        "corge/grault.py": str(input_directory / "other" / "grault.py"),
+    }
+    for source in paths.values():
+        os.makedirs(os.path.dirname(source), exist_ok=True)
+        with open(source, "wb"):
+            pass
+
+    installed_files = frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_symlink_strict",
+        output_directory,
+        {"paths": paths},
+        include=["*.pyi"],
+    )
+    assert installed_files == [output_directory / t for t in paths]
+    assert all(f.is_symlink() for f in installed_files)
+    path_runner(*paths, python_path=output_directory)
+
+
+def test_path_map_is_used_with_relative_output_directory(tmp_path, monkeypatch, dummy_paths):
+    monkeypatch.chdir(tmp_path)
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "test_symlink",
+        "out",
+        dummy_paths,
+        write_path_map=True,
+    )
+    path_map = frontend_editables.read_path_maps("out")
+    expected_paths = {t: os.path.realpath(s) for t, s in dummy_paths["paths"].items()}
+
+    def realpath(path):
+        raise AssertionError("path was not resolved from the path map", path)
+
+    monkeypatch.setattr(os.path, "realpath", realpath)
+    assert all(
+        frontend_editables.resolve_path(os.path.join("out", t), path_map) == s
+        for t, s in expected_paths.items()
+    )
+
+
+@pytest.mark.parametrize(
+    "installers",
+    [[frontend_editables.LaxSymlinkInstaller], [frontend_editables.StrictSymlinkInstaller]],
+)
+def test_path_map_sources_under_symlinked_folders_are_resolved(tmp_path, installers):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    source = tmp_path / "in" / "foo" / "__init__.py"
+    source.parent.mkdir(parents=True)
+    source.touch()
+    tmp_path.joinpath("link").symlink_to(tmp_path / "in", target_is_directory=True)
+
+    frontend_editables.install(
+        installers,
+        "test_symlink",
+        output_directory,
+        {"paths": {"foo/__init__.py": str(tmp_path / "link" / "foo" / "__init__.py")}},
+        write_path_map=True,
+    )
+    path_map = frontend_editables.read_path_maps(output_directory)
+    assert frontend_editables.resolve_path(
+        output_directory / "foo" / "__init__.py", path_map
+    ) == os.path.realpath(source)
+
+
+def test_strict_symlinks_are_synced_with_source_changes(tmp_path, dummy_dist_info):
+    source_directory = tmp_path / "in"
+    source_directory.mkdir()
+    for name in ["__init__.py", "bar.py", "baz.py"]:
+        source_directory.joinpath(name).touch()
+
+    record_path = dummy_dist_info / "RECORD"
+    old_paths = {
+        "foo/__init__.py": str(source_directory / "__init__.py"),
+        "foo/bar.py": str(source_directory / "bar.py"),
+    }
+    new_paths = {
+        "foo/__init__.py": str(source_directory / "__init__.py"),
+        "foo/baz.py": str(source_directory / "baz.py"),
+    }
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "foo",
+        tmp_path,
+        {"paths": old_paths},
+        append_to_record=record_path,
+    )
+    sync_strict_symlinks("foo", tmp_path, record_path, old_paths, new_paths)
+    assert not tmp_path.joinpath("foo", "bar.py").exists()
+    assert tmp_path.joinpath("foo", "baz.py").is_symlink()
+    assert record_path.read_text(encoding="utf-8").splitlines() == [
+        "foo-0.0.0.dist-info/METADATA,,",
+        "foo-0.0.0.dist-info/RECORD,,",
+        "foo/__init__.py,,",
+        "foo/baz.py,,",
+    ]
@@ -1,13 +1,20 @@
+import base64
+import hashlib
 import json
 import os
 import os.path
 import shutil
 import subprocess
+import sys
 import sysconfig
 import venv
+import zipfile
 
 import pytest
 
+import frontend_editables
+from frontend_editables import transitional_cli
+
 
 @pytest.fixture(autouse=True, scope="module")
 def transitional_cli_dependencies(tmp_path_factory):
@@ -74,3 +81,164 @@ def test_self_install_from_path_with_spec(test_env_executable):
         subprocess.check_output([test_env_executable, "-m", "pip", "list", "--format", "json"])
     )
     assert sum(p["name"] in {"frontend-editables", "pytest"} for p in pip_list) == 2
+
+
+def test_self_install_into_multiple_environments(tmp_path, test_env_executable):
+    other_test_env_directory = tmp_path / "other-test-env"
+    venv.create(other_test_env_directory)
+    other_test_env_executable = os.path.join(
+        sysconfig.get_paths(vars={"base": other_test_env_directory})["scripts"],
+        "python.exe" if os.name == "nt" else "python",
+    )
+    subprocess.check_call(
+        [
+            test_env_executable,
+            "-m",
+            "frontend_editables.transitional_cli",
+            "-m",
+            "pth_file",
+            "--python",
+            test_env_executable,
+            "--python",
+            other_test_env_executable,
+            "src/frontend_editables",
+            "frontend_editables",
+        ]
+    )
+    for executable in [test_env_executable, other_test_env_executable]:
+        pip_list = json.loads(
+            subprocess.check_output([executable, "-m", "pip", "list", "--format", "json"])
+        )
+        assert any(p["name"] == "frontend-editables" for p in pip_list)
+
+
+def test_rebuilt_wheel_is_retagged_as_pure(tmp_path):
+    wheel_path = tmp_path / "foo-1.0-cp311-cp311-linux_x86_64.whl"
+    wheel_metadata = (
+        "Wheel-Version: 1.0\n"
+        "Root-Is-Purelib: false\n"
+        "Tag: cp311-cp311-manylinux_2_17_x86_64\n"
+        "Tag: cp311-cp311-linux_x86_64\n"
+    )
+    with zipfile.ZipFile(wheel_path, "w") as wheel:
+        wheel.writestr("foo/__init__.py", "")
+        wheel.writestr("foo-1.0.data/scripts/bar", "")
+        wheel.writestr("foo-1.0.dist-info/WHEEL", wheel_metadata)
+        wheel.writestr(
+            "foo-1.0.dist-info/RECORD",
+            "foo/__init__.py,,\n"
+            "foo-1.0.data/scripts/bar,,\n"
+            "foo-1.0.dist-info/WHEEL,sha256=stale,1\n"
+            "foo-1.0.dist-info/RECORD,,\n",
+        )
+
+    rebuilt_wheel_path = transitional_cli._rebuild_wheel(str(tmp_path), str(wheel_path))
+    assert os.path.basename(rebuilt_wheel_path) == "foo-1.0-py3-none-any.whl"
+    assert not wheel_path.exists()
+    with zipfile.ZipFile(rebuilt_wheel_path) as wheel:
+        assert sorted(wheel.namelist()) == [
+            "foo-1.0.data/scripts/bar",
+            "foo-1.0.dist-info/RECORD",
+            "foo-1.0.dist-info/WHEEL",
+        ]
+        retagged_wheel_metadata = wheel.read("foo-1.0.dist-info/WHEEL")
+        record = wheel.read("foo-1.0.dist-info/RECORD").decode("utf-8")
+    assert retagged_wheel_metadata.decode("utf-8").splitlines() == [
+        "Wheel-Version: 1.0",
+        "Root-Is-Purelib: true",
+        "Tag: py3-none-any",
+    ]
+    digest = base64.urlsafe_b64encode(hashlib.sha256(retagged_wheel_metadata).digest())
+    assert record.splitlines() == [
+        "foo-1.0.data/scripts/bar,,",
+        f"foo-1.0.dist-info/WHEEL,sha256={digest.rstrip(b'=').decode()},"
+        f"{len(retagged_wheel_metadata)}",
+        "foo-1.0.dist-info/RECORD,,",
+    ]
+
+
+def test_include_requires_strict_symlink_method(capsys):
+    with pytest.raises(SystemExit):
+        transitional_cli.main(["-m", "lax_symlink", "--include", "foo/*", "foo", "foo"])
+    assert "--include can only be used with" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "watcher",
+    [
+        transitional_cli._PollingWatcher,
+        pytest.param(
+            transitional_cli._InotifyWatcher,
+            marks=pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only"),
+        ),
+    ],
+)
+def test_watch_follows_files_being_added_and_folders_being_removed(
+    tmp_path, monkeypatch, dummy_dist_info, watcher
+):
+    monkeypatch.chdir(tmp_path)
+    source_directory = tmp_path / "in" / "foo"
+    source_directory.mkdir(parents=True)
+    source_directory.joinpath("__init__.py").touch()
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    record_path = dummy_dist_info / "RECORD"
+
+    path_pairs = [("in/foo", "foo")]
+    paths = transitional_cli._get_path_map(path_pairs)
+    frontend_editables.install(
+        [frontend_editables.StrictSymlinkInstaller],
+        "foo",
+        output_directory,
+        {"paths": paths},
+        append_to_record=record_path,
+    )
+
+    class StopWatching(Exception):
+        pass
+
+    def add_file():
+        source_directory.joinpath("bar.py").touch()
+
+    def add_folder():
+        assert output_directory.joinpath("foo", "bar.py").is_symlink()
+        source_directory.joinpath("baz", "qux").mkdir(parents=True)
+        source_directory.joinpath("baz", "qux", "__init__.py").touch()
+
+    def remove_folder():
+        assert output_directory.joinpath("foo", "baz", "qux", "__init__.py").is_symlink()
+        output_directory.joinpath("foo", "bar.py").unlink()
+        shutil.rmtree(source_directory)
+
+    def stop():
+        raise StopWatching
+
+    steps = iter([add_file, add_folder, remove_folder, stop])
+
+    class SteppingWatcher(watcher):
+        def wait(self):
+            next(steps)()
+            return super().wait()
+
+    monkeypatch.setattr(transitional_cli, "_get_watcher", SteppingWatcher)
+    with pytest.raises(StopWatching):
+        transitional_cli._watch(
+            [("foo", str(output_directory), str(record_path))], path_pairs, paths, 0
+        )
+    assert not output_directory.joinpath("foo").exists()
+    assert record_path.read_text(encoding="utf-8").splitlines() == [
+        "foo-0.0.0.dist-info/METADATA,,",
+        "foo-0.0.0.dist-info/RECORD,,",
+    ]
+
+
+def test_watch_requires_strict_symlink_method(capsys):
+    with pytest.raises(SystemExit):
+        transitional_cli.main(["-m", "pth_file", "foo", "foo", "--watch"])
+    assert "--watch can only be used with" in capsys.readouterr().err
+
+
+def test_missing_source_paths_are_not_ignored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        transitional_cli._get_path_map([("srcc/foo", "foo")])